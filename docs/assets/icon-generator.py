@@ -3,13 +3,21 @@
 Генератор иконок для курса "Мастерство архитектуры и паттернов проектирования"
 
 Этот скрипт создает favicon файлы разных размеров из SVG иконки.
-Требует: Pillow, cairosvg (или можно использовать онлайн конвертеры)
+Требует: Pillow (или более быструю сборку pillow-simd), NumPy, cairosvg
+(или можно использовать онлайн конвертеры)
 """
 
-from pathlib import Path
-from PIL import Image, ImageDraw
-from typing import Optional, Any
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from itertools import repeat
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import PIL
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 # Цвета темы курса
 COLORS = {
@@ -23,130 +31,215 @@ COLORS = {
     "white": "#ffffff",
 }
 
+# pillow-simd - совместимая сборка Pillow с SSE4/AVX2 ускорением resize и
+# других операций над пикселями; ее версии имеют суффикс ".postN" (например, "9.5.0.post2")
+HAS_PILLOW_SIMD = ".post" in PIL.__version__ or "simd" in PIL.__version__.lower()
 
-def create_favicon(size: int, output_path: Path):
-    """Создает favicon заданного размера"""
-    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+# Размер, в котором иконка рисуется; остальные размеры получаются уменьшением
+MASTER_SIZE = 256
+
+# Самые маленькие размеры уменьшаются усреднением блоков пикселей: LANCZOS
+# дает "звон" на резких краях, а кратное уменьшение - это одно усреднение NumPy
+BOX_DOWNSAMPLE_SIZES = (16, 32)
+
+# Те же цвета в виде RGBA кортежей для заливки NumPy буфера
+RGBA = {name: ImageColor.getrgb(value) + (255,) for name, value in COLORS.items()}
+
+
+@lru_cache(maxsize=1)
+def _load_base_font() -> Any | None:
+    """Загружает системный шрифт с диска один раз (None, если его нет)"""
+    try:
+        return ImageFont.truetype("arial.ttf", 64)
+    except OSError:
+        return None
+
+
+def _get_font(font_size: int) -> Any:
+    """Возвращает шрифт нужного размера на основе закэшированного arial.ttf"""
+    base_font = _load_base_font()
+    if base_font is None:
+        return ImageFont.load_default()
+    return base_font.font_variant(size=font_size)
+
+
+def _rounded_rect_mask(xx, yy, box, radius: int):
+    """Маска прямоугольника с закругленными углами (границы включительно)"""
+    (x0, y0), (x1, y1) = box
+    mask = (xx >= x0) & (xx <= x1) & (yy >= y0) & (yy <= y1)
+    if radius <= 0:
+        return mask
+
+    # Расстояние до центра ближайшего угла (0 вне угловых квадратов)
+    dx = np.maximum(np.maximum(x0 + radius - xx, xx - (x1 - radius)), 0)
+    dy = np.maximum(np.maximum(y0 + radius - yy, yy - (y1 - radius)), 0)
+    return mask & (dx * dx + dy * dy <= radius * radius)
+
+
+def _ellipse_mask(xx, yy, box):
+    """Маска эллипса, вписанного в box (без sqrt и деления)"""
+    (x0, y0), (x1, y1) = box
+    cx = (x0 + x1) / 2
+    cy = (y0 + y1) / 2
+    rx = (x1 - x0 + 1) / 2
+    ry = (y1 - y0 + 1) / 2
+    return (xx - cx) ** 2 * (ry * ry) + (yy - cy) ** 2 * (rx * rx) <= (
+        rx * rx * ry * ry
+    )
+
+
+def _box_region(buf, box):
+    """
+    Срез буфера по габаритам фигуры и сетка координат только для него
+
+    Маска считается не по всему холсту, а по прямоугольнику фигуры, поэтому
+    каждая заливка обрабатывает лишь свои пиксели. Координаты в сетке
+    абсолютные, так что функции масок работают с ней без изменений.
+    """
+    height, width = buf.shape[:2]
+    (x0, y0), (x1, y1) = box
+    x0, y0 = max(x0, 0), max(y0, 0)
+    x1, y1 = min(x1 + 1, width), min(y1 + 1, height)
+    yy, xx = np.ogrid[y0:y1, x0:x1]
+    return buf[y0:y1, x0:x1], xx, yy
+
+
+def _fill_rounded_rect(buf, box, radius: int, color) -> None:
+    """Заливает прямоугольник с закругленными углами цветом color"""
+    region, xx, yy = _box_region(buf, box)
+    region[_rounded_rect_mask(xx, yy, box, radius)] = color
+
+
+def _fill_ellipse(buf, box, color) -> None:
+    """Заливает эллипс, вписанный в box, цветом color"""
+    region, xx, yy = _box_region(buf, box)
+    region[_ellipse_mask(xx, yy, box)] = color
+
+
+def _draw_master(size: int = MASTER_SIZE) -> Image.Image:
+    """Рисует иконку заданного размера"""
+    buf = np.zeros((size, size, 4), dtype=np.uint8)
+
+    # Функции заливки вызываются в циклах, поэтому связываем их с локальными
+    # именами один раз вместо поиска в глобальном словаре на каждом вызове
+    fill_rect = _fill_rounded_rect
+    fill_ellipse = _fill_ellipse
 
     # Фон с закругленными углами
     corner_radius = size // 8
-    draw.rounded_rectangle(
-        [(0, 0), (size, size)], radius=corner_radius, fill=COLORS["primary"]
-    )
+    fill_rect(buf, [(0, 0), (size, size)], corner_radius, RGBA["primary"])
 
-    # Масштабирование элементов
+    # Масштабирование элементов: таблица S[k] == int(k * scale) считается
+    # один раз (все используемые координаты в сетке 256px четные)
     scale = size / 256
+    S = {k: int(k * scale) for k in range(0, 201, 2)}
 
     # Основной блок (архитектура)
-    block_x = int(64 * scale)
-    block_y = int(80 * scale)
-    block_w = int(128 * scale)
-    block_h = int(96 * scale)
+    block_x = S[64]
+    block_y = S[80]
+    block_w = S[128]
+    block_h = S[96]
 
     # Основной прямоугольник
-    draw.rounded_rectangle(
+    fill_rect(
+        buf,
         [
-            (block_x, block_y + int(40 * scale)),
-            (block_x + block_w, block_y + int(40 * scale) + block_h),
+            (block_x, block_y + S[40]),
+            (block_x + block_w, block_y + S[40] + block_h),
         ],
-        radius=int(4 * scale),
-        fill=COLORS["secondary"],
+        S[4],
+        RGBA["secondary"],
     )
 
     # Внутренние слои
-    layer_margin = int(8 * scale)
-    draw.rounded_rectangle(
+    layer_margin = S[8]
+    fill_rect(
+        buf,
         [
-            (block_x + layer_margin, block_y + int(48 * scale)),
-            (
-                block_x + block_w - layer_margin,
-                block_y + int(48 * scale) + int(80 * scale),
-            ),
+            (block_x + layer_margin, block_y + S[48]),
+            (block_x + block_w - layer_margin, block_y + S[48] + S[80]),
         ],
-        radius=int(2 * scale),
-        fill=COLORS["secondary"],
-        outline=None,
+        S[2],
+        RGBA["secondary"],
     )
 
     # SOLID принципы (5 точек)
-    solid_x = block_x + int(140 * scale)
-    solid_y = block_y + int(20 * scale)
-    dot_size = int(4 * scale)
+    solid_x = block_x + S[140]
+    solid_y = block_y + S[20]
+    dot_size = S[4]
+    dot_color = RGBA["purple"]
     dot_positions = [(0, 0), (12, 0), (24, 0), (6, 8), (18, 8)]
     for dx, dy in dot_positions:
-        x = solid_x + int(dx * scale)
-        y = solid_y + int(dy * scale)
-        draw.ellipse(
+        x = solid_x + S[dx]
+        y = solid_y + S[dy]
+        fill_ellipse(
+            buf,
             [(x - dot_size, y - dot_size), (x + dot_size, y + dot_size)],
-            fill=COLORS["purple"],
+            dot_color,
         )
 
     # Паттерны (круг, квадрат, треугольник)
-    # Singleton (круг)
-    circle_x = block_x + int(32 * scale)
-    circle_y = block_y + int(32 * scale)
-    circle_r = int(12 * scale)
-    draw.ellipse(
+    # Singleton (круг) - контур того же цвета, что и заливка, поэтому
+    # достаточно одной маски
+    circle_x = block_x + S[32]
+    circle_y = block_y + S[32]
+    circle_r = S[12]
+    fill_ellipse(
+        buf,
         [
             (circle_x - circle_r, circle_y - circle_r),
             (circle_x + circle_r, circle_y + circle_r),
         ],
-        fill=COLORS["accent"],
-        outline=COLORS["accent"],
-        width=int(2 * scale),
+        RGBA["accent"],
     )
-    draw.ellipse(
+    fill_ellipse(
+        buf,
         [
-            (circle_x - int(6 * scale), circle_y - int(6 * scale)),
-            (circle_x + int(6 * scale), circle_y + int(6 * scale)),
+            (circle_x - S[6], circle_y - S[6]),
+            (circle_x + S[6], circle_y + S[6]),
         ],
-        fill=COLORS["white"],
+        RGBA["white"],
     )
 
     # Factory (квадрат)
-    square_x = block_x + int(64 * scale)
-    square_y = block_y + int(20 * scale)
-    square_size = int(24 * scale)
-    draw.rounded_rectangle(
+    square_x = block_x + S[64]
+    square_y = block_y + S[20]
+    square_size = S[24]
+    fill_rect(
+        buf,
         [(square_x, square_y), (square_x + square_size, square_y + square_size)],
-        radius=int(2 * scale),
-        fill=COLORS["success"],
-        outline=COLORS["success"],
-        width=int(2 * scale),
+        S[2],
+        RGBA["success"],
     )
 
     # Микросервисы (маленькие блоки)
-    micro_y = block_y + int(152 * scale)
-    micro_h = int(16 * scale)
-    for i, micro_x in enumerate(
-        [block_x + int(8 * scale), block_x + int(48 * scale), block_x + int(88 * scale)]
-    ):
-        micro_w = int(32 * scale)
-        draw.rounded_rectangle(
+    micro_y = block_y + S[152]
+    micro_h = S[16]
+    micro_w = S[32]
+    micro_color = RGBA["pink"]
+    for micro_x in [
+        block_x + S[8],
+        block_x + S[48],
+        block_x + S[88],
+    ]:
+        fill_rect(
+            buf,
             [(micro_x, micro_y), (micro_x + micro_w, micro_y + micro_h)],
-            radius=int(2 * scale),
-            fill=COLORS["pink"],
+            S[2],
+            micro_color,
         )
 
+    img = Image.fromarray(buf, "RGBA")
+    draw = ImageDraw.Draw(img)
+
     # Буква "A" для Architecture
     if size >= 32:
         font_size = max(12, int(size * 0.2))
-        font: Optional[Any] = None
-        try:
-            from PIL import ImageFont
-
-            # Попробуем использовать системный шрифт
-            try:
-                font = ImageFont.truetype("arial.ttf", font_size)
-            except OSError:
-                font = ImageFont.load_default()
-        except (ImportError, ModuleNotFoundError):
-            font = None
+        font = _get_font(font_size)
 
         text = "A"
         text_x = size // 2
-        text_y = int(block_y + int(200 * scale))
+        text_y = int(block_y + S[200])
 
         # Получаем размер текста
         if font:
@@ -164,24 +257,68 @@ def create_favicon(size: int, output_path: Path):
             font=font,
         )
 
-    # Сохраняем
-    img.save(output_path, format="PNG", optimize=True)
+    return img
+
+
+def _box_downsample(master: Image.Image, size: int) -> Image.Image:
+    """
+    Уменьшает иконку в целое число раз, усредняя блоки factor x factor
+
+    Цвет усредняется с весом альфа-канала, чтобы прозрачные пиксели
+    (черные с нулевой альфой) не затемняли закругленные края.
+    """
+    factor = master.width // size
+    blocks = np.asarray(master, dtype=np.float32).reshape(size, factor, size, factor, 4)
+    alpha = blocks[..., 3:]
+    alpha_sum = alpha.sum(axis=(1, 3))
+    rgb = (blocks[..., :3] * alpha).sum(axis=(1, 3)) / np.maximum(alpha_sum, 1)
+    small = np.concatenate([rgb, alpha_sum / (factor * factor)], axis=-1)
+    return Image.fromarray(np.rint(small).astype(np.uint8), "RGBA")
+
+
+def create_favicon(size: int, output_path: Path, master: Image.Image | None = None):
+    """
+    Создает favicon заданного размера
+
+    Иконка рисуется один раз в размере MASTER_SIZE, а нужный размер
+    получается уменьшением через LANCZOS (16 и 32 - усреднением блоков).
+    Чтобы не перерисовывать иконку для каждого размера, передайте уже
+    готовый master.
+    """
+    if master is None:
+        master = _draw_master()
+
+    if master.size == (size, size):
+        img = master
+    elif size in BOX_DOWNSAMPLE_SIZES and master.width % size == 0:
+        img = _box_downsample(master, size)
+    else:
+        img = master.resize((size, size), Image.Resampling.LANCZOS)
+
+    # Сохраняем в палитровом режиме, если иконка укладывается в 16 цветов без
+    # потерь: zlib сжимает однобайтовые индексы вместо четырехбайтовых RGBA
+    # пикселей. Сглаженные размеры содержат полупрозрачные края, палитра их
+    # испортила бы, поэтому они остаются в RGBA.
+    # Для крошечных иконок быстрый уровень сжатия почти не увеличивает файл,
+    # а PNG собирается в памяти и записывается на диск одним вызовом
+    out_img = img
+    if img.getcolors(16) is not None:
+        pal_img = img.quantize(colors=16, method=Image.Quantize.FASTOCTREE)
+        if pal_img.convert("RGBA").tobytes() == img.tobytes():
+            out_img = pal_img
+    png = BytesIO()
+    out_img.save(png, format="PNG", compress_level=1)
+    output_path.write_bytes(png.getvalue())
     print(f"Created {output_path.name} ({size}x{size})")
 
 
 def main():
     """Генерирует все размеры favicon"""
-    import sys
-    import io
-
-    # Устанавливаем UTF-8 для вывода
+    # Устанавливаем UTF-8 для вывода: reconfigure меняет кодировку
+    # существующих потоков на месте, без создания новых оберток
     if sys.platform == "win32":
-        sys.stdout = io.TextIOWrapper(
-            sys.stdout.buffer, encoding="utf-8", errors="replace"
-        )
-        sys.stderr = io.TextIOWrapper(
-            sys.stderr.buffer, encoding="utf-8", errors="replace"
-        )
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+        sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
     assets_dir = Path(__file__).parent
 
@@ -189,12 +326,17 @@ def main():
 
     print("Generating favicon files...")
     print(f"Directory: {assets_dir}")
+    if not HAS_PILLOW_SIMD:
+        print("Tip: pillow-simd is a faster drop-in replacement for Pillow:")
+        print("   uv add pillow-simd")
 
-    for size in sizes:
-        filename = f"favicon-{size}x{size}.png"
+    master = _draw_master()
+    output_paths = [assets_dir / f"favicon-{size}x{size}.png" for size in sizes]
 
-        output_path = assets_dir / filename
-        create_favicon(size, output_path)
+    # Размеры независимы друг от друга, поэтому уменьшение, квантование и
+    # кодирование PNG выполняются в отдельных процессах параллельно
+    with ProcessPoolExecutor(max_workers=len(sizes)) as executor:
+        list(executor.map(create_favicon, sizes, output_paths, repeat(master)))
 
     print("\nAll favicon files created!")
     print("\nFor .ico file creation use online converter:")
@@ -208,7 +350,7 @@ if __name__ == "__main__":
     except ImportError as e:
         print(f"Error: {e}")
         print("\nInstall dependencies:")
-        print("   uv add pillow")
+        print("   uv add pillow-simd numpy  (or: uv add pillow numpy)")
         sys.exit(1)
     except Exception as e:
         print(f"Error: {e}")
@@ -16,10 +16,15 @@ Features:
 - Automatic level recommendation
 """
 
-import json
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
+from functools import partial
+from itertools import islice
+from types import MappingProxyType
 from typing import Any
 
 # =============================================================================
@@ -27,7 +32,7 @@ from typing import Any
 # =============================================================================
 
 
-class DifficultyLevel(Enum):
+class DifficultyLevel(StrEnum):
     """Difficulty level enumeration"""
 
     BEGINNER = "beginner"
@@ -35,7 +40,7 @@ class DifficultyLevel(Enum):
     ADVANCED = "advanced"
 
 
-class SkillDomain(Enum):
+class SkillDomain(StrEnum):
     """Skill domain enumeration"""
 
     SOLID_PRINCIPLES = "solid_principles"
@@ -45,7 +50,19 @@ class SkillDomain(Enum):
     PROJECT_MANAGEMENT = "project_management"
 
 
-@dataclass
+# Number of latest task results kept per student
+_HISTORY_LIMIT = 64
+
+# Starting level of every skill domain for a new student
+_DEFAULT_SKILLS: dict[SkillDomain, int] = dict.fromkeys(SkillDomain, 1)
+
+# Recommended difficulty for those starting levels, keyed by domain value
+_DEFAULT_RECOMMENDATIONS: dict[str, DifficultyLevel] = {
+    domain.value: DifficultyLevel.BEGINNER for domain in SkillDomain
+}
+
+
+@dataclass(slots=True, frozen=True)
 class SkillRequirement:
     """Skill requirement for a task"""
 
@@ -54,16 +71,16 @@ class SkillRequirement:
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LearningObjective:
     """Learning objective for a task"""
 
     description: str
-    skill_requirements: list[SkillRequirement]
-    assessment_criteria: list[str]
+    skill_requirements: tuple[SkillRequirement, ...]
+    assessment_criteria: tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaskTemplate:
     """Template for generating tasks at different difficulty levels"""
 
@@ -71,17 +88,18 @@ class TaskTemplate:
     title: str
     description: str
     module: str
-    base_objectives: list[LearningObjective]
+    base_objectives: tuple[LearningObjective, ...]
     estimated_time_minutes: dict[DifficultyLevel, int]
-    prerequisites: list[str] = field(default_factory=list)
+    prerequisites: tuple[str, ...] = ()
 
     def generate_task(self, level: DifficultyLevel) -> "ProgrammingTask":
         """Generate task for specific difficulty level"""
-        generator = TaskGenerator()
-        return generator.generate_task(self, level)
+        return _get_task_generator().generate_task(self, level)
 
 
-@dataclass
+# Frozen because TaskGenerator caches one task per template and level and hands
+# the same instance to every caller
+@dataclass(slots=True, frozen=True)
 class ProgrammingTask:
     """Complete programming task with all materials"""
 
@@ -89,18 +107,36 @@ class ProgrammingTask:
     title: str
     description: str
     difficulty: DifficultyLevel
-    objectives: list[LearningObjective]
+    # Sequences are tuples so that tasks can share module-level constants
+    objectives: tuple[LearningObjective, ...]
     starter_code: str
-    instructions: list[str]
-    hints: list[str]
-    test_cases: list[str]
-    solution_template: str
-    grading_rubric: dict[str, int]
+    instructions: tuple[str, ...]
+    hints: tuple[str, ...]
+    test_cases: tuple[str, ...]
+    # Builds solution_template; the multi-KB solution is only rendered when
+    # a consumer first reads it
+    solution_factory: Callable[[], str] = field(repr=False, compare=False)
+    # Read-only view of the shared per-level rubric; mappings are not
+    # hashable, so it is left out of the hash
+    grading_rubric: Mapping[str, int] = field(hash=False)
     estimated_time: int
-    resources: list[str] = field(default_factory=list)
+    resources: tuple[str, ...] = ()
+    _solution_template: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
+    @property
+    def solution_template(self) -> str:
+        """Solution template, built on first access"""
+        template = self._solution_template
+        if template is None:
+            template = self.solution_factory()
+            # The only field set after creation, hence the frozen-class bypass
+            object.__setattr__(self, "_solution_template", template)
+        return template
 
-@dataclass
+
+@dataclass(slots=True)
 class StudentProgress:
     """Track student progress across difficulty levels"""
 
@@ -110,142 +146,32 @@ class StudentProgress:
     current_level_recommendations: dict[str, DifficultyLevel] = field(
         default_factory=dict
     )
-    performance_history: list[dict[str, Any]] = field(default_factory=list)
+    # Only the latest results feed trends and averages, so the history is
+    # capped instead of growing with every submission
+    performance_history: deque[dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=_HISTORY_LIMIT)
+    )
 
     def __post_init__(self):
-        # Initialize skill levels
-        for domain in SkillDomain:
-            if domain not in self.skill_levels:
-                self.skill_levels[domain] = 1
+        # Initialize skill levels: one dict merge, known levels take priority
+        self.skill_levels = {**_DEFAULT_SKILLS, **self.skill_levels}
+        # Every domain always has a recommendation, so reads never need a
+        # fallback
+        self.current_level_recommendations = {
+            **_DEFAULT_RECOMMENDATIONS,
+            **self.current_level_recommendations,
+        }
 
 
 # =============================================================================
-# TASK GENERATORS FOR EACH DIFFICULTY LEVEL
+# TASK CODE TEMPLATES
 # =============================================================================
 
+# Starter code and solution templates of the "srp_refactoring" task. They are
+# plain module constants rather than literals inside the generator methods,
+# which keeps the methods short; none of them has placeholders to fill in.
 
-class TaskGenerator:
-    """
-    Generate tasks based on difficulty level.
-
-    💡 Простыми словами: Это "фабрика заданий" - она создает задания разной сложности
-    из одного шаблона. Как повар готовит блюдо разной остроты из одного рецепта.
-
-    Example:
-        >>> generator = TaskGenerator()
-        >>> template = TaskTemplate(...)
-        >>> beginner_task = generator.generate_task(template, DifficultyLevel.BEGINNER)
-        >>> print(beginner_task.title)
-        '🟢 SRP Refactoring (Beginner)'
-    """
-
-    def generate_task(
-        self, template: TaskTemplate, level: DifficultyLevel
-    ) -> ProgrammingTask:
-        """
-        Generate task for specific difficulty level.
-
-        💡 Простыми словами: Берет шаблон задания и создает версию нужной сложности.
-        Для начинающих - больше подсказок, для продвинутых - меньше.
-
-        Args:
-            template: Шаблон задания (что нужно сделать)
-            level: Уровень сложности (beginner/intermediate/advanced)
-
-        Returns:
-            ProgrammingTask: Полное задание с инструкциями, кодом, тестами
-
-        Example:
-            >>> task = generator.generate_task(template, DifficultyLevel.BEGINNER)
-            >>> print(f"Time: {task.estimated_time} min")
-            >>> print(f"Hints: {len(task.hints)}")
-        """
-        if level == DifficultyLevel.BEGINNER:
-            return self._generate_beginner_task(template)
-        elif level == DifficultyLevel.INTERMEDIATE:
-            return self._generate_intermediate_task(template)
-        else:
-            return self._generate_advanced_task(template)
-
-    def _generate_beginner_task(self, template: TaskTemplate) -> ProgrammingTask:
-        """
-        Generate beginner-level task with extensive guidance.
-
-        💡 Простыми словами: Создает задание для начинающих - много подсказок,
-        готовый каркас кода, пошаговые инструкции. Как обучение вождению с инструктором.
-
-        Features:
-        - Detailed step-by-step instructions
-        - Extensive code scaffolding (много готового кода)
-        - Multiple hints at each step
-        - Simple test cases
-        - Extended time estimate
-
-        Args:
-            template: Шаблон задания
-
-        Returns:
-            ProgrammingTask: Задание для начинающих
-        """
-        return ProgrammingTask(
-            template_id=template.id,
-            title=f"🟢 {template.title} (Beginner)",
-            description=f"{template.description}\n\n🎯 **Beginner Level**: This task includes detailed step-by-step instructions, extensive code scaffolding, and guided implementation.",
-            difficulty=DifficultyLevel.BEGINNER,
-            objectives=self._simplify_objectives(template.base_objectives),
-            starter_code=self._generate_beginner_starter_code(template),
-            instructions=self._generate_beginner_instructions(template),
-            hints=self._generate_beginner_hints(template),
-            test_cases=self._generate_beginner_tests(template),
-            solution_template=self._generate_beginner_solution_template(template),
-            grading_rubric=self._generate_beginner_rubric(template),
-            estimated_time=template.estimated_time_minutes[DifficultyLevel.BEGINNER],
-            resources=self._generate_beginner_resources(template),
-        )
-
-    def _generate_intermediate_task(self, template: TaskTemplate) -> ProgrammingTask:
-        """Generate intermediate-level task"""
-        return ProgrammingTask(
-            template_id=template.id,
-            title=f"🟡 {template.title} (Intermediate)",
-            description=f"{template.description}\n\n🎯 **Intermediate Level**: This task provides moderate guidance with some autonomy in implementation decisions.",
-            difficulty=DifficultyLevel.INTERMEDIATE,
-            objectives=template.base_objectives,
-            starter_code=self._generate_intermediate_starter_code(template),
-            instructions=self._generate_intermediate_instructions(template),
-            hints=self._generate_intermediate_hints(template),
-            test_cases=self._generate_intermediate_tests(template),
-            solution_template=self._generate_intermediate_solution_template(template),
-            grading_rubric=self._generate_intermediate_rubric(template),
-            estimated_time=template.estimated_time_minutes[
-                DifficultyLevel.INTERMEDIATE
-            ],
-            resources=self._generate_intermediate_resources(template),
-        )
-
-    def _generate_advanced_task(self, template: TaskTemplate) -> ProgrammingTask:
-        """Generate advanced-level task"""
-        return ProgrammingTask(
-            template_id=template.id,
-            title=f"🔴 {template.title} (Advanced)",
-            description=f"{template.description}\n\n🎯 **Advanced Level**: This task requires independent problem-solving, architectural decisions, and additional feature implementation.",
-            difficulty=DifficultyLevel.ADVANCED,
-            objectives=self._enhance_objectives(template.base_objectives),
-            starter_code=self._generate_advanced_starter_code(template),
-            instructions=self._generate_advanced_instructions(template),
-            hints=self._generate_advanced_hints(template),
-            test_cases=self._generate_advanced_tests(template),
-            solution_template=self._generate_advanced_solution_template(template),
-            grading_rubric=self._generate_advanced_rubric(template),
-            estimated_time=template.estimated_time_minutes[DifficultyLevel.ADVANCED],
-            resources=self._generate_advanced_resources(template),
-        )
-
-    # Helper methods for code generation
-    def _generate_beginner_starter_code(self, template: TaskTemplate) -> str:
-        """Generate extensive starter code for beginners"""
-        if template.id == "srp_refactoring":
-            return '''#!/usr/bin/env python3
+_SRP_BEGINNER_STARTER = '''#!/usr/bin/env python3
 """
 Beginner Level: SRP Refactoring Exercise
 Follow the step-by-step instructions to refactor the UserService class.
@@ -392,82 +318,7 @@ if __name__ == "__main__":
     main()
 '''
 
-        return "# TODO: Implement starter code for " + template.id
-
-    def _generate_beginner_instructions(self, template: TaskTemplate) -> list[str]:
-        """Generate detailed step-by-step instructions for beginners"""
-        if template.id == "srp_refactoring":
-            return [
-                "📋 **Step 1**: Complete the UserValidator class",
-                "  • Implement the validate_user_data method",
-                "  • Add proper validation for username, email, and password",
-                "  • Return True if all validations pass, False otherwise",
-                "",
-                "📋 **Step 2**: Complete the UserRepository class",
-                "  • Implement the __init__ method to set up storage",
-                "  • Implement save_user to store user data",
-                "  • Implement find_by_username to retrieve users",
-                "",
-                "📋 **Step 3**: Complete the EmailService class",
-                "  • Implement send_welcome_email method",
-                "  • For now, just print a message (simulate email sending)",
-                "  • Return True to indicate success",
-                "",
-                "📋 **Step 4**: Complete the User class",
-                "  • Add __init__ method with username, email, password parameters",
-                "  • Store the parameters as instance variables",
-                "  • Add a __str__ method for easy printing",
-                "",
-                "📋 **Step 5**: Complete the UserService class",
-                "  • Store the injected dependencies in __init__",
-                "  • Implement create_user method using the dependencies",
-                "  • Follow the steps outlined in the method docstring",
-                "",
-                "📋 **Step 6**: Complete the main function",
-                "  • Create instances of UserValidator, UserRepository, EmailService",
-                "  • Create UserService with these dependencies",
-                "  • Test creating a user with sample data",
-                "",
-                "🎯 **Success Criteria**:",
-                "  • All classes have single responsibilities",
-                "  • Dependencies are properly injected",
-                "  • User creation works end-to-end",
-                "  • Code follows SRP principles",
-            ]
-
-        return ["Complete the implementation following the TODO comments"]
-
-    def _generate_beginner_hints(self, _template: TaskTemplate) -> list[str]:
-        """Generate helpful hints for beginners"""
-        return [
-            "💡 Start with the simplest class first (usually the data models)",
-            "💡 Implement one method at a time and test it",
-            "💡 Use print statements to debug your implementation",
-            "💡 Remember: each class should have only one reason to change",
-            "💡 If you're stuck, review the SOLID principles documentation",
-            "💡 Ask yourself: 'What is this class responsible for?'",
-        ]
-
-    def _generate_intermediate_instructions(self, template: TaskTemplate) -> list[str]:
-        """Generate instructions for intermediate level"""
-        return self._generate_beginner_instructions(template)
-
-    def _generate_intermediate_hints(self, template: TaskTemplate) -> list[str]:
-        """Generate hints for intermediate level"""
-        return self._generate_beginner_hints(template)
-
-    def _generate_advanced_instructions(self, template: TaskTemplate) -> list[str]:
-        """Generate instructions for advanced level"""
-        return self._generate_beginner_instructions(template)
-
-    def _generate_advanced_hints(self, template: TaskTemplate) -> list[str]:
-        """Generate hints for advanced level"""
-        return self._generate_beginner_hints(template)
-
-    def _generate_intermediate_starter_code(self, template: TaskTemplate) -> str:
-        """Generate moderate starter code for intermediate level"""
-        if template.id == "srp_refactoring":
-            return '''#!/usr/bin/env python3
+_SRP_INTERMEDIATE_STARTER = '''#!/usr/bin/env python3
 """
 Intermediate Level: SRP Refactoring Exercise
 Refactor the monolithic UserService into separate classes following SRP.
@@ -538,12 +389,7 @@ if __name__ == "__main__":
     main()
 '''
 
-        return "# TODO: Implement starter code for " + template.id
-
-    def _generate_advanced_starter_code(self, template: TaskTemplate) -> str:
-        """Generate minimal starter code for advanced level"""
-        if template.id == "srp_refactoring":
-            return '''#!/usr/bin/env python3
+_SRP_ADVANCED_STARTER = '''#!/usr/bin/env python3
 """
 Advanced Level: SRP Refactoring with Error Handling and Async Operations
 Create a robust user management system with proper error handling,
@@ -596,188 +442,7 @@ if __name__ == "__main__":
     main()
 '''
 
-        return "# TODO: Implement minimal starter code for " + template.id
-
-    def _simplify_objectives(
-        self, objectives: list[LearningObjective]
-    ) -> list[LearningObjective]:
-        """Simplify learning objectives for beginners"""
-        simplified = []
-        for obj in objectives:
-            # Reduce skill level requirements
-            simplified_skills = []
-            for skill in obj.skill_requirements:
-                simplified_skills.append(
-                    SkillRequirement(
-                        skill.domain,
-                        max(1, skill.level - 2),  # Reduce by 2 levels
-                        f"Basic {skill.description}",
-                    )
-                )
-
-            simplified.append(
-                LearningObjective(
-                    f"Basic {obj.description}",
-                    simplified_skills,
-                    obj.assessment_criteria[:3],  # Fewer criteria
-                )
-            )
-
-        return simplified
-
-    def _enhance_objectives(
-        self, objectives: list[LearningObjective]
-    ) -> list[LearningObjective]:
-        """Enhance learning objectives for advanced level"""
-        enhanced = []
-        for obj in objectives:
-            # Increase skill level requirements
-            enhanced_skills = []
-            for skill in obj.skill_requirements:
-                enhanced_skills.append(
-                    SkillRequirement(
-                        skill.domain,
-                        min(10, skill.level + 2),  # Increase by 2 levels
-                        f"Advanced {skill.description}",
-                    )
-                )
-
-            # Add additional requirements
-            enhanced_skills.extend(
-                [
-                    SkillRequirement(SkillDomain.ARCHITECTURE, 7, "System Design"),
-                    SkillRequirement(
-                        SkillDomain.DESIGN_PATTERNS, 8, "Pattern Application"
-                    ),
-                ]
-            )
-
-            enhanced_criteria = obj.assessment_criteria + [
-                "Error handling and edge cases",
-                "Performance optimization",
-                "Scalability considerations",
-                "Security best practices",
-                "Comprehensive testing",
-            ]
-
-            enhanced.append(
-                LearningObjective(
-                    f"Advanced {obj.description}", enhanced_skills, enhanced_criteria
-                )
-            )
-
-        return enhanced
-
-    def _generate_beginner_tests(self, _template: TaskTemplate) -> list[str]:
-        """Generate basic tests for beginners"""
-        return [
-            "Test that all required classes exist",
-            "Test that methods can be called without errors",
-            "Test basic functionality with valid inputs",
-            "Verify SRP compliance with simple checks",
-        ]
-
-    def _generate_intermediate_tests(self, _template: TaskTemplate) -> list[str]:
-        """Generate moderate tests for intermediate level"""
-        return [
-            "Test all classes and their public interfaces",
-            "Test error handling with invalid inputs",
-            "Test dependency injection works correctly",
-            "Verify design patterns are properly implemented",
-            "Test edge cases and boundary conditions",
-        ]
-
-    def _generate_advanced_tests(self, _template: TaskTemplate) -> list[str]:
-        """Generate comprehensive tests for advanced level"""
-        return [
-            "Unit tests for all components with 90%+ coverage",
-            "Integration tests for complete workflows",
-            "Performance tests under load",
-            "Security tests for vulnerabilities",
-            "Error recovery and resilience tests",
-            "Concurrent access and thread safety tests",
-            "Memory leak and resource management tests",
-        ]
-
-    def _generate_beginner_rubric(self, _template: TaskTemplate) -> dict[str, int]:
-        """Generate grading rubric for beginners"""
-        return {
-            "Code Compiles and Runs": 20,
-            "Basic Functionality": 25,
-            "Follows Instructions": 20,
-            "Code Organization": 15,
-            "Comments and Documentation": 10,
-            "SRP Basic Understanding": 10,
-        }
-
-    def _generate_intermediate_rubric(self, _template: TaskTemplate) -> dict[str, int]:
-        """Generate grading rubric for intermediate level"""
-        return {
-            "Functional Requirements": 25,
-            "Design Pattern Implementation": 20,
-            "Code Quality and Style": 15,
-            "Error Handling": 10,
-            "Testing": 10,
-            "SOLID Principles": 15,
-            "Documentation": 5,
-        }
-
-    def _generate_advanced_rubric(self, _template: TaskTemplate) -> dict[str, int]:
-        """Generate grading rubric for advanced level"""
-        return {
-            "Architecture and Design": 25,
-            "Implementation Quality": 20,
-            "Performance and Scalability": 15,
-            "Error Handling and Resilience": 10,
-            "Security Considerations": 10,
-            "Testing and Quality Assurance": 15,
-            "Innovation and Best Practices": 5,
-        }
-
-    def _generate_beginner_resources(self, _template: TaskTemplate) -> list[str]:
-        """Generate learning resources for beginners"""
-        return [
-            "📖 SOLID Principles Guide - Section 1: Introduction",
-            "🎥 Video: What is Single Responsibility Principle?",
-            "💡 Tutorial: Basic Class Design in Python",
-            "🔍 Code Examples: Simple SRP Examples",
-            "📝 Cheat Sheet: Python Class Basics",
-        ]
-
-    def _generate_intermediate_resources(self, _template: TaskTemplate) -> list[str]:
-        """Generate learning resources for intermediate level"""
-        return [
-            "📖 Clean Code - Chapter 10: Classes",
-            "🎥 Video: Dependency Injection Patterns",
-            "💡 Article: Interface Segregation in Practice",
-            "🔍 Case Study: Refactoring Legacy Code",
-            "📝 Best Practices: Error Handling in Python",
-        ]
-
-    def _generate_advanced_resources(self, _template: TaskTemplate) -> list[str]:
-        """Generate learning resources for advanced level"""
-        return [
-            "📖 Clean Architecture - Robert Martin",
-            "🎥 Conference Talk: Enterprise Architecture Patterns",
-            "💡 Research Paper: Scalable System Design",
-            "🔍 Open Source Study: Well-Architected Systems",
-            "📝 Industry Report: Performance Optimization Techniques",
-            "🏗️ Framework Documentation: FastAPI/Django Advanced Patterns",
-        ]
-
-    # Additional helper methods would be similar...
-    def _generate_beginner_solution_template(self, template: TaskTemplate) -> str:
-        """
-        Generate detailed solution template for beginner level with extensive comments.
-
-        Provides complete solution structure with:
-        - Step-by-step implementation guide
-        - Detailed code comments explaining each section
-        - Example code snippets
-        - Best practices explanations
-        """
-        if template.id == "srp_refactoring":
-            return '''#!/usr/bin/env python3
+_SRP_BEGINNER_SOLUTION = '''#!/usr/bin/env python3
 """
 Beginner Level Solution: SRP Refactoring Exercise
 Complete solution with detailed explanations
@@ -1001,71 +666,7 @@ if __name__ == "__main__":
     main()
 '''
 
-        # Generic template for other tasks
-        return f'''#!/usr/bin/env python3
-"""
-Beginner Level Solution Template: {template.title}
-Module: {template.module}
-
-This solution provides a complete implementation with detailed explanations.
-Each section includes:
-- Clear comments explaining the purpose
-- Step-by-step implementation guide
-- Best practices and patterns used
-"""
-
-from typing import Optional
-
-# ============================================================================
-# SOLUTION STRUCTURE
-# ============================================================================
-# TODO: Replace this template with actual solution for {template.id}
-#
-# Recommended structure:
-# 1. Import necessary modules
-# 2. Define data models/classes
-# 3. Implement core functionality with detailed comments
-# 4. Add error handling
-# 5. Include example usage
-# ============================================================================
-
-# Example structure (replace with actual implementation):
-def solution_function():
-    """
-    Main solution function with detailed documentation.
-
-    Steps:
-    1. [Step 1 description]
-    2. [Step 2 description]
-    3. [Step 3 description]
-    """
-    # Step 1: [Detailed explanation]
-    pass
-
-    # Step 2: [Detailed explanation]
-    pass
-
-    # Step 3: [Detailed explanation]
-    pass
-
-
-if __name__ == "__main__":
-    # Example usage with comments
-    solution_function()
-'''
-
-    def _generate_intermediate_solution_template(self, template: TaskTemplate) -> str:
-        """
-        Generate solution template for intermediate level with moderate guidance.
-
-        Provides solution structure with:
-        - Key implementation sections
-        - Moderate code comments
-        - Design pattern hints
-        - Some implementation guidance
-        """
-        if template.id == "srp_refactoring":
-            return '''#!/usr/bin/env python3
+_SRP_INTERMEDIATE_SOLUTION = '''#!/usr/bin/env python3
 """
 Intermediate Level Solution: SRP Refactoring Exercise
 Solution with moderate guidance and design pattern hints
@@ -1162,50 +763,13 @@ if __name__ == "__main__":
     main()
 '''
 
-        # Generic template for other tasks
-        return f'''#!/usr/bin/env python3
+_SRP_ADVANCED_SOLUTION = '''#!/usr/bin/env python3
 """
-Intermediate Level Solution Template: {template.title}
-Module: {template.module}
-
-Solution structure with moderate guidance.
-Key sections and design patterns are indicated.
+Advanced Level Solution: SRP Refactoring Exercise
+Minimal outline - implement complete solution independently
 """
 
-# Core implementation
-# - Consider design patterns: Strategy, Factory, Observer
-# - Implement error handling
-# - Follow SOLID principles
-# - Add appropriate type hints
-
-def solution_function():
-    """Main solution - implement core logic"""
-    # Implementation with moderate comments
-    pass
-
-
-if __name__ == "__main__":
-    solution_function()
-'''
-
-    def _generate_advanced_solution_template(self, template: TaskTemplate) -> str:
-        """
-        Generate minimal solution template for advanced level.
-
-        Provides minimal structure with:
-        - Basic code outline
-        - Architectural hints
-        - Design pattern suggestions
-        - Requires independent implementation
-        """
-        if template.id == "srp_refactoring":
-            return '''#!/usr/bin/env python3
-"""
-Advanced Level Solution: SRP Refactoring Exercise
-Minimal outline - implement complete solution independently
-"""
-
-from typing import Optional
+from typing import Optional
 
 # Implement complete solution following SRP
 # Consider: error handling, logging, configuration, testing
@@ -1264,6 +828,632 @@ class UserService:
 # - Event publishing
 '''
 
+
+# Starter code of each task by (template id, level); templates without an
+# entry get a TODO placeholder
+_STARTER_CODE: dict[tuple[str, DifficultyLevel], str] = {
+    ("srp_refactoring", DifficultyLevel.BEGINNER): _SRP_BEGINNER_STARTER,
+    ("srp_refactoring", DifficultyLevel.INTERMEDIATE): _SRP_INTERMEDIATE_STARTER,
+    ("srp_refactoring", DifficultyLevel.ADVANCED): _SRP_ADVANCED_STARTER,
+}
+
+# Solution templates by (template id, level); templates without an entry get
+# a generic outline built from the template
+_SOLUTION_TEMPLATES: dict[tuple[str, DifficultyLevel], str] = {
+    ("srp_refactoring", DifficultyLevel.BEGINNER): _SRP_BEGINNER_SOLUTION,
+    ("srp_refactoring", DifficultyLevel.INTERMEDIATE): _SRP_INTERMEDIATE_SOLUTION,
+    ("srp_refactoring", DifficultyLevel.ADVANCED): _SRP_ADVANCED_SOLUTION,
+}
+
+
+# Title prefix (level emoji) and suffix of each task
+_BEGINNER_TITLE_PREFIX = "🟢 "
+_BEGINNER_TITLE_SUFFIX = " (Beginner)"
+_INTERMEDIATE_TITLE_PREFIX = "🟡 "
+_INTERMEDIATE_TITLE_SUFFIX = " (Intermediate)"
+_ADVANCED_TITLE_PREFIX = "🔴 "
+_ADVANCED_TITLE_SUFFIX = " (Advanced)"
+
+
+# Level notes appended to the template description of each task
+
+_BEGINNER_DESC_SUFFIX = (
+    "\n\n🎯 **Beginner Level**: This task includes detailed step-by-step"
+    " instructions, extensive code scaffolding, and guided implementation."
+)
+
+_INTERMEDIATE_DESC_SUFFIX = (
+    "\n\n🎯 **Intermediate Level**: This task provides moderate guidance with"
+    " some autonomy in implementation decisions."
+)
+
+_ADVANCED_DESC_SUFFIX = (
+    "\n\n🎯 **Advanced Level**: This task requires independent problem-solving,"
+    " architectural decisions, and additional feature implementation."
+)
+
+
+# Step-by-step instructions of the "srp_refactoring" task
+_SRP_INSTRUCTIONS: tuple[str, ...] = (
+    "📋 **Step 1**: Complete the UserValidator class",
+    "  • Implement the validate_user_data method",
+    "  • Add proper validation for username, email, and password",
+    "  • Return True if all validations pass, False otherwise",
+    "",
+    "📋 **Step 2**: Complete the UserRepository class",
+    "  • Implement the __init__ method to set up storage",
+    "  • Implement save_user to store user data",
+    "  • Implement find_by_username to retrieve users",
+    "",
+    "📋 **Step 3**: Complete the EmailService class",
+    "  • Implement send_welcome_email method",
+    "  • For now, just print a message (simulate email sending)",
+    "  • Return True to indicate success",
+    "",
+    "📋 **Step 4**: Complete the User class",
+    "  • Add __init__ method with username, email, password parameters",
+    "  • Store the parameters as instance variables",
+    "  • Add a __str__ method for easy printing",
+    "",
+    "📋 **Step 5**: Complete the UserService class",
+    "  • Store the injected dependencies in __init__",
+    "  • Implement create_user method using the dependencies",
+    "  • Follow the steps outlined in the method docstring",
+    "",
+    "📋 **Step 6**: Complete the main function",
+    "  • Create instances of UserValidator, UserRepository, EmailService",
+    "  • Create UserService with these dependencies",
+    "  • Test creating a user with sample data",
+    "",
+    "🎯 **Success Criteria**:",
+    "  • All classes have single responsibilities",
+    "  • Dependencies are properly injected",
+    "  • User creation works end-to-end",
+    "  • Code follows SRP principles",
+)
+
+_DEFAULT_INSTRUCTIONS: tuple[str, ...] = (
+    "Complete the implementation following the TODO comments",
+)
+
+
+# Hints, tests, rubrics and resources do not depend on the template; they are
+# built once here and shared by every task (rubrics as read-only mappings)
+
+_BEGINNER_HINTS: tuple[str, ...] = (
+    "💡 Start with the simplest class first (usually the data models)",
+    "💡 Implement one method at a time and test it",
+    "💡 Use print statements to debug your implementation",
+    "💡 Remember: each class should have only one reason to change",
+    "💡 If you're stuck, review the SOLID principles documentation",
+    "💡 Ask yourself: 'What is this class responsible for?'",
+)
+
+_BEGINNER_TESTS: tuple[str, ...] = (
+    "Test that all required classes exist",
+    "Test that methods can be called without errors",
+    "Test basic functionality with valid inputs",
+    "Verify SRP compliance with simple checks",
+)
+
+_INTERMEDIATE_TESTS: tuple[str, ...] = (
+    "Test all classes and their public interfaces",
+    "Test error handling with invalid inputs",
+    "Test dependency injection works correctly",
+    "Verify design patterns are properly implemented",
+    "Test edge cases and boundary conditions",
+)
+
+_ADVANCED_TESTS: tuple[str, ...] = (
+    "Unit tests for all components with 90%+ coverage",
+    "Integration tests for complete workflows",
+    "Performance tests under load",
+    "Security tests for vulnerabilities",
+    "Error recovery and resilience tests",
+    "Concurrent access and thread safety tests",
+    "Memory leak and resource management tests",
+)
+
+_BEGINNER_RUBRIC: Mapping[str, int] = MappingProxyType(
+    {
+        "Code Compiles and Runs": 20,
+        "Basic Functionality": 25,
+        "Follows Instructions": 20,
+        "Code Organization": 15,
+        "Comments and Documentation": 10,
+        "SRP Basic Understanding": 10,
+    }
+)
+
+_INTERMEDIATE_RUBRIC: Mapping[str, int] = MappingProxyType(
+    {
+        "Functional Requirements": 25,
+        "Design Pattern Implementation": 20,
+        "Code Quality and Style": 15,
+        "Error Handling": 10,
+        "Testing": 10,
+        "SOLID Principles": 15,
+        "Documentation": 5,
+    }
+)
+
+_ADVANCED_RUBRIC: Mapping[str, int] = MappingProxyType(
+    {
+        "Architecture and Design": 25,
+        "Implementation Quality": 20,
+        "Performance and Scalability": 15,
+        "Error Handling and Resilience": 10,
+        "Security Considerations": 10,
+        "Testing and Quality Assurance": 15,
+        "Innovation and Best Practices": 5,
+    }
+)
+
+_BEGINNER_RESOURCES: tuple[str, ...] = (
+    "📖 SOLID Principles Guide - Section 1: Introduction",
+    "🎥 Video: What is Single Responsibility Principle?",
+    "💡 Tutorial: Basic Class Design in Python",
+    "🔍 Code Examples: Simple SRP Examples",
+    "📝 Cheat Sheet: Python Class Basics",
+)
+
+_INTERMEDIATE_RESOURCES: tuple[str, ...] = (
+    "📖 Clean Code - Chapter 10: Classes",
+    "🎥 Video: Dependency Injection Patterns",
+    "💡 Article: Interface Segregation in Practice",
+    "🔍 Case Study: Refactoring Legacy Code",
+    "📝 Best Practices: Error Handling in Python",
+)
+
+_ADVANCED_RESOURCES: tuple[str, ...] = (
+    "📖 Clean Architecture - Robert Martin",
+    "🎥 Conference Talk: Enterprise Architecture Patterns",
+    "💡 Research Paper: Scalable System Design",
+    "🔍 Open Source Study: Well-Architected Systems",
+    "📝 Industry Report: Performance Optimization Techniques",
+    "🏗️ Framework Documentation: FastAPI/Django Advanced Patterns",
+)
+
+# The materials above by difficulty level
+_TESTS_BY_LEVEL: dict[DifficultyLevel, tuple[str, ...]] = {
+    DifficultyLevel.BEGINNER: _BEGINNER_TESTS,
+    DifficultyLevel.INTERMEDIATE: _INTERMEDIATE_TESTS,
+    DifficultyLevel.ADVANCED: _ADVANCED_TESTS,
+}
+
+_RUBRIC_BY_LEVEL: dict[DifficultyLevel, Mapping[str, int]] = {
+    DifficultyLevel.BEGINNER: _BEGINNER_RUBRIC,
+    DifficultyLevel.INTERMEDIATE: _INTERMEDIATE_RUBRIC,
+    DifficultyLevel.ADVANCED: _ADVANCED_RUBRIC,
+}
+
+_RESOURCES_BY_LEVEL: dict[DifficultyLevel, tuple[str, ...]] = {
+    DifficultyLevel.BEGINNER: _BEGINNER_RESOURCES,
+    DifficultyLevel.INTERMEDIATE: _INTERMEDIATE_RESOURCES,
+    DifficultyLevel.ADVANCED: _ADVANCED_RESOURCES,
+}
+
+
+# Requirements and criteria added to every objective at the advanced level
+_EXTRA_ADVANCED_SKILLS: tuple[SkillRequirement, ...] = (
+    SkillRequirement(SkillDomain.ARCHITECTURE, 7, "System Design"),
+    SkillRequirement(SkillDomain.DESIGN_PATTERNS, 8, "Pattern Application"),
+)
+
+_EXTRA_ADVANCED_CRITERIA: tuple[str, ...] = (
+    "Error handling and edge cases",
+    "Performance optimization",
+    "Scalability considerations",
+    "Security best practices",
+    "Comprehensive testing",
+)
+
+
+# =============================================================================
+# TASK GENERATORS FOR EACH DIFFICULTY LEVEL
+# =============================================================================
+
+
+class TaskGenerator:
+    """
+    Generate tasks based on difficulty level.
+
+    💡 Простыми словами: Это "фабрика заданий" - она создает задания разной сложности
+    из одного шаблона. Как повар готовит блюдо разной остроты из одного рецепта.
+
+    Example:
+        >>> generator = TaskGenerator()
+        >>> template = TaskTemplate(...)
+        >>> beginner_task = generator.generate_task(template, DifficultyLevel.BEGINNER)
+        >>> print(beginner_task.title)
+        '🟢 SRP Refactoring (Beginner)'
+    """
+
+    def __init__(self):
+        # Generated tasks by (template object, level); tasks are read-only once
+        # built, so repeated requests share one instance. Keyed by identity,
+        # as two templates may share an id; the template is stored with its
+        # task, which keeps it alive so its id() cannot be reused.
+        self._task_cache: dict[
+            tuple[int, DifficultyLevel], tuple[TaskTemplate, ProgrammingTask]
+        ] = {}
+        # Task builder for each level: one dict lookup instead of comparing
+        # the level against every member
+        self._dispatch: dict[
+            DifficultyLevel, Callable[[TaskTemplate], ProgrammingTask]
+        ] = {
+            DifficultyLevel.BEGINNER: self._generate_beginner_task,
+            DifficultyLevel.INTERMEDIATE: self._generate_intermediate_task,
+            DifficultyLevel.ADVANCED: self._generate_advanced_task,
+        }
+
+    def generate_task(
+        self, template: TaskTemplate, level: DifficultyLevel
+    ) -> ProgrammingTask:
+        """
+        Generate task for specific difficulty level.
+
+        💡 Простыми словами: Берет шаблон задания и создает версию нужной сложности.
+        Для начинающих - больше подсказок, для продвинутых - меньше.
+
+        Args:
+            template: Шаблон задания (что нужно сделать)
+            level: Уровень сложности (beginner/intermediate/advanced)
+
+        Returns:
+            ProgrammingTask: Полное задание с инструкциями, кодом, тестами.
+            Задание кэшируется для каждого объекта шаблона и уровня и
+            используется повторно, поэтому его нельзя изменять.
+
+        Example:
+            >>> task = generator.generate_task(template, DifficultyLevel.BEGINNER)
+            >>> print(f"Time: {task.estimated_time} min")
+            >>> print(f"Hints: {len(task.hints)}")
+        """
+        key = (id(template), level)
+        cached = self._task_cache.get(key)
+        if cached is not None and cached[0] is template:
+            return cached[1]
+
+        task = self._dispatch[level](template)
+        self._task_cache[key] = (template, task)
+        return task
+
+    def generate_tasks_batch(
+        self,
+        templates: Iterable[TaskTemplate],
+        levels: Iterable[DifficultyLevel] = tuple(DifficultyLevel),
+    ) -> list[ProgrammingTask]:
+        """
+        Generate tasks for every combination of templates and levels.
+
+        💡 Простыми словами: Создает сразу весь набор заданий, например для
+        подготовки курса. Уже созданные задания берутся из кэша.
+
+        Args:
+            templates: Шаблоны заданий
+            levels: Уровни сложности (по умолчанию - все)
+
+        Returns:
+            Задания в порядке шаблонов, внутри шаблона - в порядке уровней
+
+        Example:
+            >>> tasks = generator.generate_tasks_batch(library.list_templates())
+            >>> print(len(tasks))  # шаблоны x 3 уровня
+        """
+        levels = tuple(levels)
+        generate = self.generate_task
+        return [generate(template, level) for template in templates for level in levels]
+
+    def _generate_beginner_task(self, template: TaskTemplate) -> ProgrammingTask:
+        """
+        Generate beginner-level task with extensive guidance.
+
+        💡 Простыми словами: Создает задание для начинающих - много подсказок,
+        готовый каркас кода, пошаговые инструкции. Как обучение вождению с инструктором.
+
+        Features:
+        - Detailed step-by-step instructions
+        - Extensive code scaffolding (много готового кода)
+        - Multiple hints at each step
+        - Simple test cases
+        - Extended time estimate
+
+        Args:
+            template: Шаблон задания
+
+        Returns:
+            ProgrammingTask: Задание для начинающих
+        """
+        return ProgrammingTask(
+            template_id=template.id,
+            title=sys.intern(
+                _BEGINNER_TITLE_PREFIX + template.title + _BEGINNER_TITLE_SUFFIX
+            ),
+            description="".join((template.description, _BEGINNER_DESC_SUFFIX)),
+            difficulty=DifficultyLevel.BEGINNER,
+            objectives=self._simplify_objectives(template.base_objectives),
+            starter_code=self._generate_beginner_starter_code(template),
+            instructions=self._generate_beginner_instructions(template),
+            hints=self._generate_beginner_hints(),
+            test_cases=self._tests_for(DifficultyLevel.BEGINNER),
+            solution_factory=partial(
+                self._generate_beginner_solution_template, template
+            ),
+            grading_rubric=self._rubric_for(DifficultyLevel.BEGINNER),
+            estimated_time=template.estimated_time_minutes[DifficultyLevel.BEGINNER],
+            resources=self._resources_for(DifficultyLevel.BEGINNER),
+        )
+
+    def _generate_intermediate_task(self, template: TaskTemplate) -> ProgrammingTask:
+        """Generate intermediate-level task"""
+        return ProgrammingTask(
+            template_id=template.id,
+            title=sys.intern(
+                _INTERMEDIATE_TITLE_PREFIX + template.title + _INTERMEDIATE_TITLE_SUFFIX
+            ),
+            description="".join((template.description, _INTERMEDIATE_DESC_SUFFIX)),
+            difficulty=DifficultyLevel.INTERMEDIATE,
+            objectives=template.base_objectives,
+            starter_code=self._generate_intermediate_starter_code(template),
+            instructions=self._generate_intermediate_instructions(template),
+            hints=self._generate_intermediate_hints(),
+            test_cases=self._tests_for(DifficultyLevel.INTERMEDIATE),
+            solution_factory=partial(
+                self._generate_intermediate_solution_template, template
+            ),
+            grading_rubric=self._rubric_for(DifficultyLevel.INTERMEDIATE),
+            estimated_time=template.estimated_time_minutes[
+                DifficultyLevel.INTERMEDIATE
+            ],
+            resources=self._resources_for(DifficultyLevel.INTERMEDIATE),
+        )
+
+    def _generate_advanced_task(self, template: TaskTemplate) -> ProgrammingTask:
+        """Generate advanced-level task"""
+        return ProgrammingTask(
+            template_id=template.id,
+            title=sys.intern(
+                _ADVANCED_TITLE_PREFIX + template.title + _ADVANCED_TITLE_SUFFIX
+            ),
+            description="".join((template.description, _ADVANCED_DESC_SUFFIX)),
+            difficulty=DifficultyLevel.ADVANCED,
+            objectives=self._enhance_objectives(template.base_objectives),
+            starter_code=self._generate_advanced_starter_code(template),
+            instructions=self._generate_advanced_instructions(template),
+            hints=self._generate_advanced_hints(),
+            test_cases=self._tests_for(DifficultyLevel.ADVANCED),
+            solution_factory=partial(
+                self._generate_advanced_solution_template, template
+            ),
+            grading_rubric=self._rubric_for(DifficultyLevel.ADVANCED),
+            estimated_time=template.estimated_time_minutes[DifficultyLevel.ADVANCED],
+            resources=self._resources_for(DifficultyLevel.ADVANCED),
+        )
+
+    # Helper methods for code generation
+    def _generate_beginner_starter_code(self, template: TaskTemplate) -> str:
+        """Generate extensive starter code for beginners"""
+        starter_code = _STARTER_CODE.get((template.id, DifficultyLevel.BEGINNER))
+        if starter_code is None:
+            return "# TODO: Implement starter code for " + template.id
+        return starter_code
+
+    def _generate_beginner_instructions(
+        self, template: TaskTemplate
+    ) -> tuple[str, ...]:
+        """Generate detailed step-by-step instructions for beginners"""
+        if template.id == "srp_refactoring":
+            return _SRP_INSTRUCTIONS
+
+        return _DEFAULT_INSTRUCTIONS
+
+    @staticmethod
+    def _generate_beginner_hints() -> tuple[str, ...]:
+        """Generate helpful hints for beginners"""
+        return _BEGINNER_HINTS
+
+    # Instructions and hints are currently the same at every level
+    _generate_intermediate_instructions = _generate_beginner_instructions
+    _generate_intermediate_hints = _generate_beginner_hints
+    _generate_advanced_instructions = _generate_beginner_instructions
+    _generate_advanced_hints = _generate_beginner_hints
+
+    def _generate_intermediate_starter_code(self, template: TaskTemplate) -> str:
+        """Generate moderate starter code for intermediate level"""
+        starter_code = _STARTER_CODE.get((template.id, DifficultyLevel.INTERMEDIATE))
+        if starter_code is None:
+            return "# TODO: Implement starter code for " + template.id
+        return starter_code
+
+    def _generate_advanced_starter_code(self, template: TaskTemplate) -> str:
+        """Generate minimal starter code for advanced level"""
+        starter_code = _STARTER_CODE.get((template.id, DifficultyLevel.ADVANCED))
+        if starter_code is None:
+            return "# TODO: Implement minimal starter code for " + template.id
+        return starter_code
+
+    def _simplify_objectives(
+        self, objectives: tuple[LearningObjective, ...]
+    ) -> tuple[LearningObjective, ...]:
+        """Simplify learning objectives for beginners"""
+        return tuple(
+            LearningObjective(
+                f"Basic {obj.description}",
+                # Reduce skill level requirements by 2 levels
+                tuple(
+                    SkillRequirement(
+                        skill.domain,
+                        max(1, skill.level - 2),
+                        f"Basic {skill.description}",
+                    )
+                    for skill in obj.skill_requirements
+                ),
+                obj.assessment_criteria[:3],  # Fewer criteria
+            )
+            for obj in objectives
+        )
+
+    def _enhance_objectives(
+        self, objectives: tuple[LearningObjective, ...]
+    ) -> tuple[LearningObjective, ...]:
+        """Enhance learning objectives for advanced level"""
+        return tuple(
+            LearningObjective(
+                f"Advanced {obj.description}",
+                # Increase skill level requirements by 2 levels and add
+                # the additional requirements
+                tuple(
+                    SkillRequirement(
+                        skill.domain,
+                        min(10, skill.level + 2),
+                        f"Advanced {skill.description}",
+                    )
+                    for skill in obj.skill_requirements
+                )
+                + _EXTRA_ADVANCED_SKILLS,
+                obj.assessment_criteria + _EXTRA_ADVANCED_CRITERIA,
+            )
+            for obj in objectives
+        )
+
+    @staticmethod
+    def _tests_for(level: DifficultyLevel) -> tuple[str, ...]:
+        """Generate test descriptions for the level"""
+        return _TESTS_BY_LEVEL[level]
+
+    @staticmethod
+    def _rubric_for(level: DifficultyLevel) -> Mapping[str, int]:
+        """Generate grading rubric for the level"""
+        return _RUBRIC_BY_LEVEL[level]
+
+    @staticmethod
+    def _resources_for(level: DifficultyLevel) -> tuple[str, ...]:
+        """Generate learning resources for the level"""
+        return _RESOURCES_BY_LEVEL[level]
+
+    # Additional helper methods would be similar...
+    def _generate_beginner_solution_template(self, template: TaskTemplate) -> str:
+        """
+        Generate detailed solution template for beginner level with extensive comments.
+
+        Provides complete solution structure with:
+        - Step-by-step implementation guide
+        - Detailed code comments explaining each section
+        - Example code snippets
+        - Best practices explanations
+        """
+        solution = _SOLUTION_TEMPLATES.get((template.id, DifficultyLevel.BEGINNER))
+        if solution is not None:
+            return solution
+
+        # Generic template for other tasks
+        return f'''#!/usr/bin/env python3
+"""
+Beginner Level Solution Template: {template.title}
+Module: {template.module}
+
+This solution provides a complete implementation with detailed explanations.
+Each section includes:
+- Clear comments explaining the purpose
+- Step-by-step implementation guide
+- Best practices and patterns used
+"""
+
+from typing import Optional
+
+# ============================================================================
+# SOLUTION STRUCTURE
+# ============================================================================
+# TODO: Replace this template with actual solution for {template.id}
+#
+# Recommended structure:
+# 1. Import necessary modules
+# 2. Define data models/classes
+# 3. Implement core functionality with detailed comments
+# 4. Add error handling
+# 5. Include example usage
+# ============================================================================
+
+# Example structure (replace with actual implementation):
+def solution_function():
+    """
+    Main solution function with detailed documentation.
+
+    Steps:
+    1. [Step 1 description]
+    2. [Step 2 description]
+    3. [Step 3 description]
+    """
+    # Step 1: [Detailed explanation]
+    pass
+
+    # Step 2: [Detailed explanation]
+    pass
+
+    # Step 3: [Detailed explanation]
+    pass
+
+
+if __name__ == "__main__":
+    # Example usage with comments
+    solution_function()
+'''
+
+    def _generate_intermediate_solution_template(self, template: TaskTemplate) -> str:
+        """
+        Generate solution template for intermediate level with moderate guidance.
+
+        Provides solution structure with:
+        - Key implementation sections
+        - Moderate code comments
+        - Design pattern hints
+        - Some implementation guidance
+        """
+        solution = _SOLUTION_TEMPLATES.get((template.id, DifficultyLevel.INTERMEDIATE))
+        if solution is not None:
+            return solution
+
+        # Generic template for other tasks
+        return f'''#!/usr/bin/env python3
+"""
+Intermediate Level Solution Template: {template.title}
+Module: {template.module}
+
+Solution structure with moderate guidance.
+Key sections and design patterns are indicated.
+"""
+
+# Core implementation
+# - Consider design patterns: Strategy, Factory, Observer
+# - Implement error handling
+# - Follow SOLID principles
+# - Add appropriate type hints
+
+def solution_function():
+    """Main solution - implement core logic"""
+    # Implementation with moderate comments
+    pass
+
+
+if __name__ == "__main__":
+    solution_function()
+'''
+
+    def _generate_advanced_solution_template(self, template: TaskTemplate) -> str:
+        """
+        Generate minimal solution template for advanced level.
+
+        Provides minimal structure with:
+        - Basic code outline
+        - Architectural hints
+        - Design pattern suggestions
+        - Requires independent implementation
+        """
+        solution = _SOLUTION_TEMPLATES.get((template.id, DifficultyLevel.ADVANCED))
+        if solution is not None:
+            return solution
+
         # Generic template for other tasks
         return f'''#!/usr/bin/env python3
 """
@@ -1292,16 +1482,67 @@ if __name__ == "__main__":
 '''
 
 
+# A single TaskGenerator serves every template and shares its task cache
+_TASK_GENERATOR: TaskGenerator | None = None
+
+
+def _get_task_generator() -> TaskGenerator:
+    """Return the shared TaskGenerator, creating it on first use"""
+    global _TASK_GENERATOR
+    if _TASK_GENERATOR is None:
+        _TASK_GENERATOR = TaskGenerator()
+    return _TASK_GENERATOR
+
+
 # =============================================================================
 # ADAPTIVE LEARNING SYSTEM
 # =============================================================================
 
 
+# Recommended difficulty by skill level (index 0 unused): 1-3 beginner,
+# 4-7 intermediate, 8-10 advanced
+_LEVEL_TO_DIFFICULTY: tuple[DifficultyLevel, ...] = (
+    (DifficultyLevel.BEGINNER,) * 4
+    + (DifficultyLevel.INTERMEDIATE,) * 4
+    + (DifficultyLevel.ADVANCED,) * 3
+)
+
+
+def _latest(history: deque[dict[str, Any]], count: int) -> list[dict[str, Any]]:
+    """Return the last count entries of a history deque, oldest first"""
+    latest = list(islice(reversed(history), count))
+    latest.reverse()
+    return latest
+
+
+# Skill domain trained by the tasks of each course module
+_MODULE_DOMAINS: dict[str, SkillDomain] = {
+    "SOLID": SkillDomain.SOLID_PRINCIPLES,
+    "Patterns": SkillDomain.DESIGN_PATTERNS,
+    "Architecture": SkillDomain.ARCHITECTURE,
+}
+
+
+def _guess_task_domain(task_id: str) -> SkillDomain:
+    """Guess the skill domain of a task id that has no known template"""
+    if "srp" in task_id or "solid" in task_id:
+        return SkillDomain.SOLID_PRINCIPLES
+    if "pattern" in task_id:
+        return SkillDomain.DESIGN_PATTERNS
+    if "architecture" in task_id:
+        return SkillDomain.ARCHITECTURE
+    return SkillDomain.SOLID_PRINCIPLES  # Default
+
+
 class ProgressTracker:
     """Track student progress and recommend difficulty levels"""
 
-    def __init__(self):
+    def __init__(self, task_domains: dict[str, SkillDomain] | None = None):
         self.students: dict[str, StudentProgress] = {}
+        # Skill domain of each known task id (see TaskLibrary.task_domains)
+        if task_domains is None:
+            task_domains = TaskLibrary().task_domains
+        self._task_domains = task_domains
 
     def get_student_progress(self, student_id: str) -> StudentProgress:
         """Get or create student progress"""
@@ -1320,7 +1561,41 @@ class ProgressTracker:
     ):
         """Record task completion"""
         progress = self.get_student_progress(student_id)
+        self._record_result(progress, task_id, score, max_score, time_taken, difficulty)
+
+        # Update level recommendations
+        self._update_level_recommendations(progress)
+
+    def record_task_completions(
+        self,
+        results: Iterable[tuple[str, str, float, float, int, DifficultyLevel]],
+    ):
+        """Record many task completions, refreshing recommendations once per student
 
+        Each result holds the record_task_completion arguments in order.
+        """
+        touched: dict[str, StudentProgress] = {}
+        for student_id, task_id, score, max_score, time_taken, difficulty in results:
+            progress = touched.get(student_id)
+            if progress is None:
+                progress = touched[student_id] = self.get_student_progress(student_id)
+            self._record_result(
+                progress, task_id, score, max_score, time_taken, difficulty
+            )
+
+        for progress in touched.values():
+            self._update_level_recommendations(progress)
+
+    def _record_result(
+        self,
+        progress: StudentProgress,
+        task_id: str,
+        score: float,
+        max_score: float,
+        time_taken: int,
+        difficulty: DifficultyLevel,
+    ):
+        """Store a result and update skill levels without refreshing recommendations"""
         # Calculate percentage safely, guarding against zero or negative max_score
         percentage = 0.0 if max_score <= 0 else score / max_score * 100
 
@@ -1330,8 +1605,8 @@ class ProgressTracker:
             "max_score": max_score,
             "percentage": percentage,
             "time_taken": time_taken,
-            "difficulty": difficulty.value,
-            "timestamp": datetime.now().isoformat(),
+            "difficulty": difficulty,
+            "timestamp": datetime.now(),
         }
 
         progress.performance_history.append(performance)
@@ -1340,26 +1615,19 @@ class ProgressTracker:
         # Update skill levels based on performance
         self._update_skill_levels(progress, performance)
 
-        # Update level recommendations
-        self._update_level_recommendations(progress)
-
     def _update_skill_levels(
         self, progress: StudentProgress, performance: dict[str, Any]
     ):
         """Update skill levels based on performance"""
         percentage = performance["percentage"]
-        difficulty = DifficultyLevel(performance["difficulty"])
+        difficulty = performance["difficulty"]
 
-        # Determine which skills to update (simplified logic)
+        # Determine which skills to update: by template, falling back to
+        # keywords in the id for tasks outside the library
         task_id = performance["task_id"]
-        if "srp" in task_id or "solid" in task_id:
-            domain = SkillDomain.SOLID_PRINCIPLES
-        elif "pattern" in task_id:
-            domain = SkillDomain.DESIGN_PATTERNS
-        elif "architecture" in task_id:
-            domain = SkillDomain.ARCHITECTURE
-        else:
-            domain = SkillDomain.SOLID_PRINCIPLES  # Default
+        domain = self._task_domains.get(task_id)
+        if domain is None:
+            domain = _guess_task_domain(task_id)
 
         # Update skill level
         current_level = progress.skill_levels[domain]
@@ -1382,17 +1650,11 @@ class ProgressTracker:
 
     def _update_level_recommendations(self, progress: StudentProgress):
         """Update difficulty level recommendations"""
-        for domain in SkillDomain:
-            skill_level = progress.skill_levels[domain]
-
-            if skill_level <= 3:
-                recommended = DifficultyLevel.BEGINNER
-            elif skill_level <= 7:
-                recommended = DifficultyLevel.INTERMEDIATE
-            else:
-                recommended = DifficultyLevel.ADVANCED
-
-            progress.current_level_recommendations[domain.value] = recommended
+        skill_levels = progress.skill_levels
+        progress.current_level_recommendations.update(
+            (domain.value, _LEVEL_TO_DIFFICULTY[skill_levels[domain]])
+            for domain in SkillDomain
+        )
 
     def recommend_difficulty(
         self, student_id: str, task_template: TaskTemplate
@@ -1401,18 +1663,11 @@ class ProgressTracker:
         progress = self.get_student_progress(student_id)
 
         # Get relevant skill domains for the task (simplified)
-        if task_template.module == "SOLID":
-            domain = SkillDomain.SOLID_PRINCIPLES
-        elif task_template.module == "Patterns":
-            domain = SkillDomain.DESIGN_PATTERNS
-        elif task_template.module == "Architecture":
-            domain = SkillDomain.ARCHITECTURE
-        else:
-            domain = SkillDomain.SOLID_PRINCIPLES
+        domain = _MODULE_DOMAINS.get(task_template.module, SkillDomain.SOLID_PRINCIPLES)
 
-        return progress.current_level_recommendations.get(
-            domain.value, DifficultyLevel.BEGINNER
-        )
+        # Recommendations are refreshed on every submission, so reading one is
+        # a single lookup
+        return progress.current_level_recommendations[domain.value]
 
     def get_progress_summary(self, student_id: str) -> dict[str, Any]:
         """Get comprehensive progress summary"""
@@ -1420,9 +1675,7 @@ class ProgressTracker:
 
         # Calculate statistics
         total_tasks = len(progress.completed_tasks)
-        recent_performance = (
-            progress.performance_history[-5:] if progress.performance_history else []
-        )
+        recent_performance = _latest(progress.performance_history, 5)
         avg_recent_score = (
             sum(p["percentage"] for p in recent_performance) / len(recent_performance)
             if recent_performance
@@ -1432,23 +1685,26 @@ class ProgressTracker:
         return {
             "student_id": student_id,
             "total_tasks_completed": total_tasks,
-            "skill_levels": dict(progress.skill_levels),
+            # Keyed by domain value like the recommendations, so the summary
+            # can be dumped as JSON
+            "skill_levels": {
+                domain.value: level for domain, level in progress.skill_levels.items()
+            },
             "current_recommendations": dict(progress.current_level_recommendations),
             "average_recent_performance": round(avg_recent_score, 2),
             "performance_trend": self._calculate_trend(progress.performance_history),
             "suggested_next_topics": self._suggest_next_topics(progress),
         }
 
-    def _calculate_trend(self, performance_history: list[dict[str, Any]]) -> str:
+    def _calculate_trend(self, performance_history: deque[dict[str, Any]]) -> str:
         """Calculate performance trend"""
         if len(performance_history) < 3:
             return "insufficient_data"
 
-        recent_scores = [p["percentage"] for p in performance_history[-5:]]
+        latest_scores = [p["percentage"] for p in _latest(performance_history, 10)]
+        recent_scores = latest_scores[-5:]
         earlier_scores = (
-            [p["percentage"] for p in performance_history[-10:-5]]
-            if len(performance_history) >= 10
-            else recent_scores
+            latest_scores[:-5] if len(performance_history) >= 10 else recent_scores
         )
 
         recent_avg = sum(recent_scores) / len(recent_scores)
@@ -1488,6 +1744,13 @@ class TaskLibrary:
 
     def __init__(self):
         self.templates = self._initialize_templates()
+        # Skill domain trained by each template, keyed by template id
+        self.task_domains: dict[str, SkillDomain] = {
+            template_id: _MODULE_DOMAINS.get(
+                template.module, SkillDomain.SOLID_PRINCIPLES
+            )
+            for template_id, template in self.templates.items()
+        }
 
     def _initialize_templates(self) -> dict[str, TaskTemplate]:
         """Initialize task templates"""
@@ -1497,37 +1760,37 @@ class TaskLibrary:
                 title="User Service SRP Refactoring",
                 description="Refactor a monolithic UserService class to follow Single Responsibility Principle by separating validation, persistence, and notification concerns.",
                 module="SOLID",
-                base_objectives=[
+                base_objectives=(
                     LearningObjective(
                         "Apply Single Responsibility Principle",
-                        [
+                        (
                             SkillRequirement(
                                 SkillDomain.SOLID_PRINCIPLES, 5, "SRP Understanding"
-                            )
-                        ],
-                        [
+                            ),
+                        ),
+                        (
                             "Separate concerns properly",
                             "Create focused classes",
                             "Implement dependency injection",
-                        ],
-                    )
-                ],
+                        ),
+                    ),
+                ),
                 estimated_time_minutes={
                     DifficultyLevel.BEGINNER: 120,
                     DifficultyLevel.INTERMEDIATE: 90,
                     DifficultyLevel.ADVANCED: 180,
                 },
-                prerequisites=["Basic Python", "Class Design"],
+                prerequisites=("Basic Python", "Class Design"),
             ),
             "ecommerce_patterns": TaskTemplate(
                 id="ecommerce_patterns",
                 title="E-commerce System with Design Patterns",
                 description="Build a complete e-commerce system applying multiple design patterns for payment processing, notifications, order management, and enhancements.",
                 module="Patterns",
-                base_objectives=[
+                base_objectives=(
                     LearningObjective(
                         "Apply Multiple Design Patterns",
-                        [
+                        (
                             SkillRequirement(
                                 SkillDomain.DESIGN_PATTERNS, 6, "Strategy Pattern"
                             ),
@@ -1537,54 +1800,54 @@ class TaskLibrary:
                             SkillRequirement(
                                 SkillDomain.DESIGN_PATTERNS, 5, "Factory Pattern"
                             ),
-                        ],
-                        [
+                        ),
+                        (
                             "Implement Strategy pattern",
                             "Create Observer system",
                             "Build Factory classes",
-                        ],
-                    )
-                ],
+                        ),
+                    ),
+                ),
                 estimated_time_minutes={
                     DifficultyLevel.BEGINNER: 240,
                     DifficultyLevel.INTERMEDIATE: 180,
                     DifficultyLevel.ADVANCED: 360,
                 },
-                prerequisites=["SOLID Principles", "Basic Design Patterns"],
+                prerequisites=("SOLID Principles", "Basic Design Patterns"),
             ),
             "blog_platform": TaskTemplate(
                 id="blog_platform",
                 title="Blog Platform Monolithic Architecture",
                 description="Create a blog platform following clean monolithic architecture principles with proper layering, domain modeling, and API design.",
                 module="Architecture",
-                base_objectives=[
+                base_objectives=(
                     LearningObjective(
                         "Design Clean Monolithic Architecture",
-                        [
+                        (
                             SkillRequirement(
                                 SkillDomain.ARCHITECTURE, 7, "Clean Architecture"
                             ),
                             SkillRequirement(
                                 SkillDomain.DOMAIN_DRIVEN_DESIGN, 5, "Domain Modeling"
                             ),
-                        ],
-                        [
+                        ),
+                        (
                             "Create layered architecture",
                             "Implement repository pattern",
                             "Design clean APIs",
-                        ],
-                    )
-                ],
+                        ),
+                    ),
+                ),
                 estimated_time_minutes={
                     DifficultyLevel.BEGINNER: 360,
                     DifficultyLevel.INTERMEDIATE: 300,
                     DifficultyLevel.ADVANCED: 480,
                 },
-                prerequisites=[
+                prerequisites=(
                     "Design Patterns",
                     "Web Development Basics",
                     "Database Design",
-                ],
+                ),
             ),
         }
 
@@ -1611,8 +1874,8 @@ class AdaptiveLearningSystem:
 
     def __init__(self):
         self.task_library = TaskLibrary()
-        self.progress_tracker = ProgressTracker()
-        self.task_generator = TaskGenerator()
+        self.progress_tracker = ProgressTracker(self.task_library.task_domains)
+        self.task_generator = _get_task_generator()
 
     def get_personalized_task(
         self, student_id: str, template_id: str
@@ -1651,6 +1914,16 @@ class AdaptiveLearningSystem:
             student_id, task_id, score, max_score, time_taken, difficulty
         )
 
+    def submit_batch(
+        self,
+        results: Iterable[tuple[str, str, float, float, int, DifficultyLevel]],
+    ):
+        """Submit many task results at once, e.g. when importing history
+
+        Each result holds the submit_task_result arguments in order.
+        """
+        self.progress_tracker.record_task_completions(results)
+
     def get_student_dashboard(self, student_id: str) -> dict[str, Any]:
         """Get student dashboard with progress and recommendations"""
         return self.progress_tracker.get_progress_summary(student_id)
@@ -1692,51 +1965,77 @@ class AdaptiveLearningSystem:
 # =============================================================================
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize enums and datetimes that json.dumps cannot handle"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(data: Any) -> str:
+    """Format data (e.g. a student dashboard) as indented JSON"""
+    # Only the dashboard commands need json, so it is not imported on load
+    import json
+
+    return json.dumps(data, indent=2, default=_json_default)
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write buffered output lines with a single stdout call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def demo_adaptive_system():
     """Demonstrate the adaptive learning system"""
-    print("🎓 Adaptive Learning System Demo")
-    print("=" * 50)
+    lines = ["🎓 Adaptive Learning System Demo", "=" * 50]
 
     system = AdaptiveLearningSystem()
 
     # Simulate student learning journey
     student_id = "student_001"
 
-    print(f"\n👨‍🎓 Student: {student_id}")
-    print("Initial dashboard:")
+    lines.append(f"\n👨‍🎓 Student: {student_id}")
+    lines.append("Initial dashboard:")
     dashboard = system.get_student_dashboard(student_id)
-    print(json.dumps(dashboard, indent=2))
+    lines.append(_dump_json(dashboard))
 
     # Get first task
-    print("\n📝 Getting personalized task...")
+    lines.append("\n📝 Getting personalized task...")
+    # get_personalized_task prints its own report, so flush what came before
+    _write_lines(lines)
     task = system.get_personalized_task(student_id, "srp_refactoring")
 
-    print(f"Title: {task.title}")
-    print(f"Difficulty: {task.difficulty.value}")
-    print(f"Estimated time: {task.estimated_time} minutes")
-    print(f"Instructions ({len(task.instructions)} steps):")
+    lines = [
+        f"Title: {task.title}",
+        f"Difficulty: {task.difficulty.value}",
+        f"Estimated time: {task.estimated_time} minutes",
+        f"Instructions ({len(task.instructions)} steps):",
+    ]
     for i, instruction in enumerate(task.instructions[:3], 1):
-        print(f"  {i}. {instruction}")
+        lines.append(f"  {i}. {instruction}")
     if len(task.instructions) > 3:
-        print(f"  ... and {len(task.instructions) - 3} more steps")
+        lines.append(f"  ... and {len(task.instructions) - 3} more steps")
 
     # Simulate task completion
-    print("\n✅ Simulating task completion...")
+    lines.append("\n✅ Simulating task completion...")
     system.submit_task_result(
         student_id, "srp_refactoring", 85, 100, 110, task.difficulty
     )
 
     # Updated dashboard
-    print("\n📊 Updated dashboard:")
+    lines.append("\n📊 Updated dashboard:")
     dashboard = system.get_student_dashboard(student_id)
-    print(json.dumps(dashboard, indent=2))
+    lines.append(_dump_json(dashboard))
 
     # Recommend next task
     next_task = system.recommend_next_task(student_id)
-    print(f"\n🎯 Recommended next task: {next_task}")
+    lines.append(f"\n🎯 Recommended next task: {next_task}")
 
     # Show how difficulty adapts
-    print("\n🔄 Getting next task (difficulty should adapt)...")
+    lines.append("\n🔄 Getting next task (difficulty should adapt)...")
+    _write_lines(lines)
     if next_task:
         next_task_obj = system.get_personalized_task(student_id, next_task)
         print(f"Next task difficulty: {next_task_obj.difficulty.value}")
@@ -1800,12 +2099,17 @@ def main():
                 difficulty = DifficultyLevel(args.level)
                 task = template.generate_task(difficulty)
 
-                print(f"📝 {task.title}")
-                print(f"🎯 Difficulty: {task.difficulty.value}")
-                print(f"📊 Estimated time: {task.estimated_time} minutes")
-                print("\nInstructions:")
-                for i, instruction in enumerate(task.instructions, 1):
-                    print(f"{i}. {instruction}")
+                lines = [
+                    f"📝 {task.title}",
+                    f"🎯 Difficulty: {task.difficulty.value}",
+                    f"📊 Estimated time: {task.estimated_time} minutes",
+                    "\nInstructions:",
+                ]
+                lines.extend(
+                    f"{i}. {instruction}"
+                    for i, instruction in enumerate(task.instructions, 1)
+                )
+                _write_lines(lines)
             else:
                 print(f"❌ Task template not found: {args.task}")
         else:
@@ -1817,17 +2121,18 @@ def main():
         # Show student dashboard
         dashboard = system.get_student_dashboard(args.student)
         print(f"📊 Dashboard for {args.student}:")
-        print(json.dumps(dashboard, indent=2))
+        print(_dump_json(dashboard))
 
     else:
         # Show available templates
-        print("📚 Available Task Templates:")
+        lines = ["📚 Available Task Templates:"]
         for template in system.task_library.list_templates():
-            print(f"  • {template.id}: {template.title}")
-            print(f"    Module: {template.module}")
-            print(
+            lines.append(f"  • {template.id}: {template.title}")
+            lines.append(f"    Module: {template.module}")
+            lines.append(
                 f"    Time: {template.estimated_time_minutes[DifficultyLevel.INTERMEDIATE]} min (intermediate)"
             )
+        _write_lines(lines)
 
 
 if __name__ == "__main__":